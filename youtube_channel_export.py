@@ -2,52 +2,186 @@
 """Export YouTube channel videos and metadata to CSV files."""
 
 import argparse
+import collections
+import concurrent.futures
 import csv
-import json
+import itertools
 import os
+import random
 import re
 import sys
+import threading
 import time
 from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlencode
-from urllib.request import urlopen, Request
+
+import httpx
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # orjson is optional; stdlib json works on bytes too
+    import json
+
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode("utf-8")  # noqa: E731
+    _JSONDecodeError = json.JSONDecodeError
 
 API_BASE = "https://www.googleapis.com/youtube/v3"
 
+# One client per process: keep-alive + TLS reuse instead of a fresh
+# handshake per request, and HTTP/2 so the threaded fetchers multiplex
+# concurrent requests over a single connection to googleapis.com. httpx
+# clients are thread-safe, so the thread pools share their process's
+# instance. Created lazily: forked pool workers must not reuse the
+# parent's established sockets, so _init_worker drops the inherited
+# client and each worker builds its own on first use.
+_client: Optional["httpx.Client"] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> "httpx.Client":
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=8, max_connections=16
+                    ),
+                    timeout=30.0,
+                )
+    return _client
+
+# Statuses worth retrying; httpx has no adapter-level Retry, so http_get
+# backs off and retries these itself. API error bodies carry the same
+# codes (plus 403 for quota exhaustion), so both layers are checked.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ERROR_CODES = frozenset({403, 429, 500, 503})
+_MAX_RETRIES = 5
+
+
+def _backoff(attempt: int) -> float:
+    # Exponential with jitter, capped at a minute.
+    return min(60.0, 2 ** attempt + random.random())
+
+
+# ETag cache for conditional requests: the API answers 304 (no body,
+# cheaper on quota) when nothing changed, and we replay the payload we
+# saved alongside the ETag. Persisted to a sidecar file in the output
+# directory between runs. Only the channel-resolution endpoints are
+# cached: they run in the parent (so the sidecar actually gets saved)
+# and their payloads are small, whereas caching playlistItems/videos
+# pages would keep every video payload resident and mirror the whole
+# API response set onto disk.
+_ETAG_ENDPOINTS = frozenset({"channels", "search"})
+_etag_cache: Dict[str, Dict] = {}
+_etag_cache_path: Optional[str] = None
+_etag_lock = threading.Lock()
+
+
+def _etag_key(path: str, params: Dict[str, str]) -> str:
+    # The API key is deliberately excluded so it never lands on disk.
+    return path + "?" + urlencode(
+        sorted((k, v) for k, v in params.items() if k != "key")
+    )
+
+
+def load_etag_cache(outdir: str) -> None:
+    global _etag_cache_path
+    _etag_cache_path = os.path.join(outdir, ".etag_cache.json")
+    try:
+        with open(_etag_cache_path, "rb") as f:
+            _etag_cache.update(_json_loads(f.read()))
+    except (OSError, ValueError):
+        pass
+
+
+def save_etag_cache() -> None:
+    if not _etag_cache_path or not _etag_cache:
+        return
+    # Atomic replace so a crash mid-write never corrupts the sidecar.
+    tmp_path = _etag_cache_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(_etag_cache))
+        os.replace(tmp_path, _etag_cache_path)
+    except OSError:
+        pass
+
+
+_RE_CHANNEL_URL = re.compile(r"youtube\.com/channel/([A-Za-z0-9_-]+)")
+_RE_USER_URL = re.compile(r"youtube\.com/user/([A-Za-z0-9_-]+)")
+_RE_HANDLE_URL = re.compile(r"youtube\.com/@([A-Za-z0-9_.-]+)")
+_RE_CUSTOM_URL = re.compile(r"youtube\.com/c/([A-Za-z0-9_.-]+)")
+# Maps filesystem-unsafe filename characters to "_" in one translate pass.
+_FN_TRANS = str.maketrans({c: "_" for c in '\\/:*?"<>|'})
+
 class YouTubeApiError(RuntimeError):
     pass
 
 
 def http_get(path: str, params: Dict[str, str]) -> Dict:
-    url = f"{API_BASE}/{path}?{urlencode(params)}"
-    req = Request(url, headers={"Accept": "application/json"})
-    with urlopen(req) as resp:
-        data = resp.read().decode("utf-8")
-    try:
-        payload = json.loads(data)
-    except json.JSONDecodeError as exc:
-        raise YouTubeApiError(f"Invalid JSON from API: {exc}")
-    if "error" in payload:
-        raise YouTubeApiError(payload["error"].get("message", "API error"))
-    return payload
+    cacheable = path in _ETAG_ENDPOINTS
+    cached = None
+    if cacheable:
+        cache_key = _etag_key(path, params)
+        with _etag_lock:
+            cached = _etag_cache.get(cache_key)
+    headers = {"Accept": "application/json"}
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+    for attempt in range(_MAX_RETRIES):
+        resp = _get_client().get(f"{API_BASE}/{path}", params=params, headers=headers)
+        if resp.status_code == 304 and cached:
+            return cached["payload"]
+        try:
+            payload = _json_loads(resp.content)
+        except _JSONDecodeError as exc:
+            if resp.status_code in _RETRY_STATUSES and attempt < _MAX_RETRIES - 1:
+                # 5xx bodies are often HTML, not JSON; back off and retry.
+                time.sleep(_backoff(attempt))
+                continue
+            raise YouTubeApiError(f"Invalid JSON from API: {exc}")
+        error = payload.get("error")
+        if error:
+            retryable = (
+                error.get("code") in _RETRY_ERROR_CODES
+                or resp.status_code in _RETRY_STATUSES
+            )
+            if retryable and attempt < _MAX_RETRIES - 1:
+                time.sleep(_backoff(attempt))
+                continue
+            raise YouTubeApiError(error.get("message", "API error"))
+        if cacheable:
+            etag = payload.get("etag")
+            if etag:
+                with _etag_lock:
+                    _etag_cache[cache_key] = {"etag": etag, "payload": payload}
+        return payload
 
 
 def sanitize_filename(name: str) -> str:
     name = name.strip() or "channel"
-    name = re.sub(r"[\\/:*?\"<>|]", "_", name)
-    name = re.sub(r"\s+", " ", name)
+    name = name.translate(_FN_TRANS)
+    name = " ".join(name.split())
     return name[:120]
 
 
 def read_channels(path: str) -> List[str]:
-    channels: List[str] = []
+    # One bulk read + splitlines keeps the line scan in C instead of
+    # iterating the file object line by line.
     with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            value = line.strip()
-            if not value or value.startswith("#"):
-                continue
-            channels.append(value)
-    return channels
+        data = f.read()
+    return [
+        value
+        for value in (line.strip() for line in data.splitlines())
+        if value and not value.startswith("#")
+    ]
 
 
 def extract_channel_identifier(value: str) -> Tuple[str, str]:
@@ -58,31 +192,45 @@ def extract_channel_identifier(value: str) -> Tuple[str, str]:
     if v.startswith("UC") and len(v) >= 20:
         return "id", v
 
-    # URLs
-    m = re.search(r"youtube\.com/channel/([A-Za-z0-9_-]+)", v)
-    if m:
-        return "id", m.group(1)
+    # URLs: classify by the path segment after "youtube.com/" with a single
+    # substring scan, then run only the one regex that can match.
+    pos = v.find("youtube.com/")
+    if pos >= 0:
+        rest = v[pos + 12 :]
+        if rest.startswith("channel/"):
+            m = _RE_CHANNEL_URL.search(v)
+            if m:
+                return "id", m.group(1)
+        elif rest.startswith("user/"):
+            m = _RE_USER_URL.search(v)
+            if m:
+                return "username", m.group(1)
+        elif rest.startswith("@"):
+            m = _RE_HANDLE_URL.search(v)
+            if m:
+                return "query", m.group(1)
+        elif rest.startswith("c/"):
+            m = _RE_CUSTOM_URL.search(v)
+            if m:
+                return "query", m.group(1)
+    elif v.startswith("@"):
+        return "query", v[1:]
 
-    m = re.search(r"youtube\.com/user/([A-Za-z0-9_-]+)", v)
-    if m:
-        return "username", m.group(1)
+    return "query", v
 
-    # Handle or custom URL
-    m = re.search(r"youtube\.com/@([A-Za-z0-9_.-]+)", v)
-    if m:
-        return "query", m.group(1)
 
-    if v.startswith("@"):
-        return "query", v[1:]
+_channel_id_cache: Dict[str, Optional[str]] = {}
+_channel_details_cache: Dict[str, Dict] = {}
 
-    m = re.search(r"youtube\.com/c/([A-Za-z0-9_.-]+)", v)
-    if m:
-        return "query", m.group(1)
 
-    return "query", v
+def resolve_channel_id(api_key: str, value: str) -> Optional[str]:
+    # Input files often repeat channels; one lookup per distinct value.
+    if value not in _channel_id_cache:
+        _channel_id_cache[value] = _resolve_channel_id(api_key, value)
+    return _channel_id_cache[value]
 
 
-def resolve_channel_id(api_key: str, value: str) -> Optional[str]:
+def _resolve_channel_id(api_key: str, value: str) -> Optional[str]:
     kind, ident = extract_channel_identifier(value)
     if kind == "id":
         return ident
@@ -118,78 +266,187 @@ def resolve_channel_id(api_key: str, value: str) -> Optional[str]:
     return items[0]["snippet"]["channelId"]
 
 
-def get_channel_details(api_key: str, channel_id: str) -> Dict:
-    payload = http_get(
-        "channels",
-        {
-            "part": "snippet,contentDetails,statistics",
-            "id": channel_id,
-            "key": api_key,
-        },
-    )
-    items = payload.get("items", [])
-    if not items:
-        raise YouTubeApiError(f"Channel not found: {channel_id}")
-    return items[0]
+def uploads_playlist_for(channel_id: str) -> str:
+    """Derive the uploads playlist ID ("UU...") from a channel ID ("UC...")."""
+    return "UU" + channel_id[2:]
 
 
-def iter_uploads_playlist_video_ids(
-    api_key: str, uploads_playlist_id: str
-) -> Iterable[str]:
-    page_token = ""
-    while True:
-        params = {
-            "part": "contentDetails",
-            "playlistId": uploads_playlist_id,
-            "maxResults": "50",
-            "key": api_key,
-        }
-        if page_token:
-            params["pageToken"] = page_token
-        payload = http_get("playlistItems", params)
-        for item in payload.get("items", []):
-            vid = item.get("contentDetails", {}).get("videoId")
-            if vid:
-                yield vid
-        page_token = payload.get("nextPageToken", "")
-        if not page_token:
-            break
-
+def get_channels_details_batch(
+    api_key: str, channel_ids: List[str]
+) -> Dict[str, Dict]:
+    """Fetch metadata for many channels at once (50 IDs per request).
 
-def chunks(items: List[str], size: int) -> Iterable[List[str]]:
-    for i in range(0, len(items), size):
-        yield items[i : i + size]
-
-
-def fetch_videos_details(api_key: str, video_ids: List[str]) -> List[Dict]:
-    details: List[Dict] = []
-    for batch in chunks(video_ids, 50):
+    Returns a dict keyed by channel ID; IDs the API does not know are
+    simply absent from the result.
+    """
+    missing = [
+        cid for cid in _unique(channel_ids) if cid not in _channel_details_cache
+    ]
+    for batch in chunks(missing, 50):
         payload = http_get(
-            "videos",
+            "channels",
             {
                 "part": "snippet,contentDetails,statistics",
                 "id": ",".join(batch),
-                "maxResults": "50",
                 "key": api_key,
             },
         )
-        details.extend(payload.get("items", []))
-        time.sleep(0.1)
-    return details
+        for item in payload.get("items", []):
+            _channel_details_cache[item["id"]] = item
+    return {
+        cid: _channel_details_cache[cid]
+        for cid in channel_ids
+        if cid in _channel_details_cache
+    }
+
+
+def _fetch_playlist_page(
+    api_key: str, uploads_playlist_id: str, page_token: str
+) -> Dict:
+    params = {
+        "part": "contentDetails",
+        "playlistId": uploads_playlist_id,
+        "maxResults": "50",
+        "key": api_key,
+    }
+    if page_token:
+        params["pageToken"] = page_token
+    return http_get("playlistItems", params)
 
 
-def format_tags(tags: Optional[List[str]]) -> str:
-    if not tags:
-        return ""
-    return "|".join(tags)
+def iter_uploads_playlist_video_ids(
+    api_key: str, uploads_playlist_id: str
+) -> Iterable[str]:
+    # Double-buffer the pagination: request page N+1 in the background
+    # while the caller consumes page N, so we never idle on the RTT.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
+        payload = _fetch_playlist_page(api_key, uploads_playlist_id, "")
+        while True:
+            page_token = payload.get("nextPageToken", "")
+            future = None
+            if page_token:
+                future = ex.submit(
+                    _fetch_playlist_page, api_key, uploads_playlist_id, page_token
+                )
+            for item in payload.get("items", []):
+                vid = item.get("contentDetails", {}).get("videoId")
+                if vid:
+                    yield vid
+            if future is None:
+                break
+            payload = future.result()
+
+
+def chunks(items: Iterable[str], size: int) -> Iterable[List[str]]:
+    it = iter(items)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            break
+        yield batch
+
+
+def _fetch_videos_batch(api_key: str, batch: List[str]) -> List[Dict]:
+    payload = http_get(
+        "videos",
+        {
+            "part": "snippet,contentDetails,statistics",
+            "id": ",".join(batch),
+            "maxResults": "50",
+            "key": api_key,
+        },
+    )
+    return payload.get("items", [])
+
+
+def _unique(items: Iterable[str]) -> Iterable[str]:
+    """Yield items in order, skipping any already seen."""
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+def fetch_videos_details(api_key: str, video_ids: Iterable[str]) -> Iterable[Dict]:
+    # The work is network-bound, so run batches concurrently over the
+    # shared client; http_get backs off and retries any 429s itself.
+    # Yield batches as they come back (in order) with a bounded window of
+    # in-flight requests, so memory stays flat regardless of channel size.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+        pending: collections.deque = collections.deque()
+        batches = chunks(_unique(video_ids), 50)
+        for batch in itertools.islice(batches, 8):
+            pending.append(ex.submit(_fetch_videos_batch, api_key, batch))
+        while pending:
+            yield from pending.popleft().result()
+            for batch in itertools.islice(batches, 1):
+                pending.append(ex.submit(_fetch_videos_batch, api_key, batch))
+
+
+# Shared read-only fallback for absent snippet/statistics/contentDetails,
+# so the hot row loop never builds a throwaway dict per lookup.
+_EMPTY: Dict = {}
+
+# The videos CSV schema is fixed, so rows are formatted by hand instead
+# of through csv.writer's generic dialect machinery. Count columns are
+# digit strings straight from the API and skip the quote scan entirely.
+_CSV_NEEDS_QUOTE = re.compile(r'[",\r\n]')
+_NUMERIC_COLS = frozenset({14, 15, 16, 17})  # view/like/comment/favorite
+
+
+def _csv_field(value: str) -> str:
+    # RFC 4180: quote only when the field contains a comma, quote, or
+    # newline; embedded quotes are doubled.
+    if _CSV_NEEDS_QUOTE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _encode_row(row: Tuple) -> bytes:
+    line = ",".join(
+        field if i in _NUMERIC_COLS else _csv_field(field)
+        for i, field in enumerate(row)
+    )
+    return line.encode("utf-8") + b"\r\n"
+
+
+def _build_row(
+    video: Dict, source_input: str, channel_id: str, channel_title: str
+) -> Tuple:
+    snippet = video.get("snippet") or _EMPTY
+    stats = video.get("statistics") or _EMPTY
+    content = video.get("contentDetails") or _EMPTY
+    tags = snippet.get("tags")
+    return (
+        source_input,
+        channel_id,
+        channel_title,
+        video.get("id", ""),
+        snippet.get("title", ""),
+        snippet.get("description", ""),
+        snippet.get("publishedAt", ""),
+        "|".join(tags) if tags else "",
+        snippet.get("categoryId", ""),
+        content.get("duration", ""),
+        content.get("definition", ""),
+        content.get("caption", ""),
+        str(content.get("licensedContent", "")),
+        content.get("projection", ""),
+        stats.get("viewCount", ""),
+        stats.get("likeCount", ""),
+        stats.get("commentCount", ""),
+        stats.get("favoriteCount", ""),
+    )
 
 
 def write_videos_info(
     out_path: str,
     channel: Dict,
-    videos: List[Dict],
+    videos: Iterable[Dict],
     source_input: str,
-) -> None:
+) -> int:
+    """Stream video rows to out_path, returning the number written."""
     header = [
         "source_input",
         "channel_id",
@@ -214,36 +471,24 @@ def write_videos_info(
     channel_id = channel.get("id", "")
     channel_title = channel.get("snippet", {}).get("title", "")
 
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(header)
+    count = 0
+
+    def encoded_rows() -> Iterable[bytes]:
+        nonlocal count
         for video in videos:
-            snippet = video.get("snippet", {})
-            stats = video.get("statistics", {})
-            content = video.get("contentDetails", {})
-            writer.writerow(
-                [
-                    source_input,
-                    channel_id,
-                    channel_title,
-                    video.get("id", ""),
-                    snippet.get("title", ""),
-                    snippet.get("description", ""),
-                    snippet.get("publishedAt", ""),
-                    format_tags(snippet.get("tags")),
-                    snippet.get("categoryId", ""),
-                    content.get("duration", ""),
-                    content.get("definition", ""),
-                    content.get("caption", ""),
-                    str(content.get("licensedContent", "")),
-                    content.get("projection", ""),
-                    stats.get("viewCount", ""),
-                    stats.get("likeCount", ""),
-                    stats.get("commentCount", ""),
-                    stats.get("favoriteCount", ""),
-                ]
+            count += 1
+            yield _encode_row(
+                _build_row(video, source_input, channel_id, channel_title)
             )
 
+    # A 1 MiB binary buffer batches the many small row writes into few
+    # syscalls; rows are pre-encoded UTF-8 bytes, so no text layer needed.
+    with open(out_path, "wb", buffering=1 << 20) as f:
+        f.write(_encode_row(tuple(header)))
+        # writelines drives the loop in C; the generator keeps streaming.
+        f.writelines(encoded_rows())
+    return count
+
 
 def write_channels_csv(out_path: str, rows: List[Dict[str, str]]) -> None:
     header = [
@@ -261,8 +506,51 @@ def write_channels_csv(out_path: str, rows: List[Dict[str, str]]) -> None:
     with open(out_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=header)
         writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
+
+
+def _init_worker() -> None:
+    # Forked workers inherit the parent's client object and its open
+    # keep-alive sockets; reusing those shared descriptors from several
+    # processes would interleave frames. Abandon the inherited instance
+    # (without closing the parent's fds) so this worker builds a fresh
+    # connection pool on first use. Workers only hit the uncached
+    # playlistItems/videos endpoints, so they never touch the ETag
+    # sidecar — persistence stays entirely in the parent.
+    global _client
+    _client = None
+
+
+def _process_channel(job: Tuple[str, str, str, Optional[Dict], str]) -> Tuple[str, str]:
+    """Export one channel's videos CSV (runs in a worker process).
+
+    job is (api_key, source input value, channel_id, channel details or
+    None when metadata was skipped, videos CSV path). The parent builds
+    one job per channel with a unique output path, so no two workers
+    ever write the same file. Returns ("ok"|"error", message) so the
+    parent can print results in input order.
+    """
+    api_key, value, channel_id, channel, videos_info_path = job
+    try:
+        if channel is None:
+            channel = {"id": channel_id}
+            uploads: Optional[str] = uploads_playlist_for(channel_id)
+        else:
+            uploads = (
+                channel.get("contentDetails", {})
+                .get("relatedPlaylists", {})
+                .get("uploads")
+            )
+
+        videos: Iterable[Dict] = ()
+        if uploads:
+            video_ids = iter_uploads_playlist_video_ids(api_key, uploads)
+            videos = fetch_videos_details(api_key, video_ids)
+
+        written = write_videos_info(videos_info_path, channel, videos, value)
+        return "ok", f"Wrote {written} videos to {videos_info_path}"
+    except Exception as exc:  # defensive: keep processing next channels
+        return "error", f"{value}: {exc}"
 
 
 def main() -> int:
@@ -278,6 +566,14 @@ def main() -> int:
         default=os.getenv("YT_API_KEY", ""),
         help="YouTube Data API key (or set YT_API_KEY env var)",
     )
+    parser.add_argument(
+        "--skip-channel-meta",
+        action="store_true",
+        help=(
+            "Skip channel metadata lookups and channels_metadata.csv; "
+            "derive each uploads playlist directly from the channel ID"
+        ),
+    )
     args = parser.parse_args()
 
     if not args.api_key:
@@ -285,6 +581,7 @@ def main() -> int:
         return 2
 
     os.makedirs(args.outdir, exist_ok=True)
+    load_etag_cache(args.outdir)
     channels = read_channels(args.input)
     if not channels:
         print("No channels found in input file.")
@@ -292,62 +589,120 @@ def main() -> int:
 
     channel_rows: List[Dict[str, str]] = []
 
+    # Pass 1: resolve every input to a channel ID, then fetch all channel
+    # metadata in batches of 50 IDs instead of one request per channel.
+    resolved: List[Tuple[str, str]] = []
     for value in channels:
         try:
             channel_id = resolve_channel_id(args.api_key, value)
-            if not channel_id:
-                print(f"[skip] Could not resolve channel: {value}")
-                continue
-
-            channel = get_channel_details(args.api_key, channel_id)
-            channel_snippet = channel.get("snippet", {})
-            channel_stats = channel.get("statistics", {})
-            channel_rows.append(
-                {
-                    "source_input": value,
-                    "channel_id": channel.get("id", ""),
-                    "channel_title": channel_snippet.get("title", ""),
-                    "channel_description": channel_snippet.get("description", ""),
-                    "channel_published_at": channel_snippet.get("publishedAt", ""),
-                    "channel_country": channel_snippet.get("country", ""),
-                    "channel_view_count": channel_stats.get("viewCount", ""),
-                    "channel_subscriber_count": channel_stats.get(
-                        "subscriberCount", ""
-                    ),
-                    "channel_video_count": channel_stats.get("videoCount", ""),
-                }
-            )
-            uploads = (
-                channel.get("contentDetails", {})
-                .get("relatedPlaylists", {})
-                .get("uploads")
+        except Exception as exc:
+            print(f"[error] {value}: {exc}", file=sys.stderr)
+            continue
+        if not channel_id:
+            print(f"[skip] Could not resolve channel: {value}")
+            continue
+        resolved.append((value, channel_id))
+
+    # Duplicate inputs resolve to the same channel; export each channel
+    # once (under its first source value) so no two jobs share a file.
+    seen_ids = set()
+    deduped: List[Tuple[str, str]] = []
+    for value, channel_id in resolved:
+        if channel_id not in seen_ids:
+            seen_ids.add(channel_id)
+            deduped.append((value, channel_id))
+    resolved = deduped
+
+    details_by_id: Dict[str, Dict] = {}
+    if not args.skip_channel_meta:
+        try:
+            details_by_id = get_channels_details_batch(
+                args.api_key, [cid for _, cid in resolved]
             )
-            channel_title = channel.get("snippet", {}).get("title", "channel")
-            filename = sanitize_filename(channel_title)
+        except YouTubeApiError as exc:
+            print(f"[error] fetching channel metadata: {exc}", file=sys.stderr)
+
+    # Pass 2: build per-channel jobs from the prefetched metadata, then
+    # fan them out to worker processes. JSON decoding and CSV emission
+    # are CPU-bound Python work, so processes scale where threads would
+    # serialize on the GIL.
+    jobs: List[Tuple[str, str, str, Optional[Dict], str]] = []
+    used_filenames = set()
+    for value, channel_id in resolved:
+        if args.skip_channel_meta:
+            filename = sanitize_filename(channel_id)
+            if filename in used_filenames:
+                filename = f"{filename}_{channel_id}"
+            used_filenames.add(filename)
             videos_info_path = os.path.join(
                 args.outdir, f"{filename}_videosinfo.csv"
             )
-
-            videos: List[Dict] = []
-            if uploads:
-                video_ids = list(iter_uploads_playlist_video_ids(args.api_key, uploads))
-                if video_ids:
-                    videos = fetch_videos_details(args.api_key, video_ids)
-
-            write_videos_info(videos_info_path, channel, videos, value)
+            jobs.append((args.api_key, value, channel_id, None, videos_info_path))
+            continue
+
+        channel = details_by_id.get(channel_id)
+        if channel is None:
+            print(f"[error] {value}: Channel not found: {channel_id}", file=sys.stderr)
+            continue
+        channel_snippet = channel.get("snippet", {})
+        channel_stats = channel.get("statistics", {})
+        channel_rows.append(
+            {
+                "source_input": value,
+                "channel_id": channel.get("id", ""),
+                "channel_title": channel_snippet.get("title", ""),
+                "channel_description": channel_snippet.get("description", ""),
+                "channel_published_at": channel_snippet.get("publishedAt", ""),
+                "channel_country": channel_snippet.get("country", ""),
+                "channel_view_count": channel_stats.get("viewCount", ""),
+                "channel_subscriber_count": channel_stats.get(
+                    "subscriberCount", ""
+                ),
+                "channel_video_count": channel_stats.get("videoCount", ""),
+            }
+        )
+        uploads = (
+            channel.get("contentDetails", {})
+            .get("relatedPlaylists", {})
+            .get("uploads")
+        )
+        if (
+            uploads
+            and channel_id.startswith("UC")
+            and uploads != uploads_playlist_for(channel_id)
+        ):
+            # The API response disagreeing with the UC->UU invariant
+            # usually means a typo'd or recycled channel ID.
             print(
-                f"[ok] Wrote {len(videos)} videos to {videos_info_path}"
+                f"[warn] {value}: uploads playlist {uploads} does not "
+                f"match channel id {channel_id}"
             )
-
-        except YouTubeApiError as exc:
-            print(f"[error] {value}: {exc}", file=sys.stderr)
-        except Exception as exc:  # defensive: keep processing next channels
-            print(f"[error] {value}: {exc}", file=sys.stderr)
-
-    channels_csv_path = os.path.join(args.outdir, "channels_metadata.csv")
-    write_channels_csv(channels_csv_path, channel_rows)
-    print(f"[ok] Wrote {len(channel_rows)} channels to {channels_csv_path}")
-
+        # Distinct channels can sanitize to the same title; suffix with
+        # the channel ID so every job gets its own output path.
+        filename = sanitize_filename(channel_snippet.get("title", "channel"))
+        if filename in used_filenames:
+            filename = f"{filename}_{channel_id}"
+        used_filenames.add(filename)
+        videos_info_path = os.path.join(args.outdir, f"{filename}_videosinfo.csv")
+        jobs.append((args.api_key, value, channel_id, channel, videos_info_path))
+
+    if jobs:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(len(jobs), os.cpu_count() or 1),
+            initializer=_init_worker,
+        ) as ex:
+            for status, message in ex.map(_process_channel, jobs):
+                if status == "ok":
+                    print(f"[ok] {message}")
+                else:
+                    print(f"[error] {message}", file=sys.stderr)
+
+    if not args.skip_channel_meta:
+        channels_csv_path = os.path.join(args.outdir, "channels_metadata.csv")
+        write_channels_csv(channels_csv_path, channel_rows)
+        print(f"[ok] Wrote {len(channel_rows)} channels to {channels_csv_path}")
+
+    save_etag_cache()
     return 0
 
 